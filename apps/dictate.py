@@ -13,15 +13,36 @@ Usage:
 
 import os
 import sys
+import importlib.util
 import time
-import wave
-import tempfile
+import shutil
+import subprocess
 import argparse
+import threading
 import signal
-from datetime import datetime
+import queue
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+def physical_cpu_count():
+    """Number of physical CPU cores; SMT siblings only slow down the encoder's GEMMs"""
+    try:
+        import psutil
+        count = psutil.cpu_count(logical=False)
+    except ImportError:
+        count = None
+    return count or max(1, (os.cpu_count() or 2) // 2)
+
+# OpenMP/MKL size their thread pools when torch is imported, so default them
+# to the physical core count before whisper pulls torch in
+for _var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, str(physical_cpu_count()))
 
 try:
+    import numba
     import pyaudio
+    import torch
     import whisper
     import numpy as np
     import pyperclip  # For clipboard operations
@@ -32,9 +53,51 @@ except ImportError:
     print("pip install openai-whisper pyaudio numpy pyperclip pyautogui keyboard")
     sys.exit(1)
 
+try:
+    import webrtcvad  # Optional, for the voice activity gate
+except ImportError:
+    webrtcvad = None
+
+VALID_MODELS = ["tiny", "base", "small", "medium", "large", "turbo"]
+
+# Number of loaded models kept around in interactive mode for fast switching
+MODEL_CACHE_SIZE = 2
+
+# Audio parameters shared by every input stream
+FORMAT = pyaudio.paInt16
+CHANNELS = 1
+RATE = 16000
+CHUNK = 1024
+RING_CHUNKS = 4  # Minimum recordings the continuous capture ring holds
+
+# Voice activity gate: 20 ms frames, and how many of them must contain speech
+# before a recording is worth sending to Whisper
+VAD_FRAME_MS = 20
+VAD_MIN_VOICED_FRAMES = 3
+VAD_ENERGY_THRESHOLD = 0.01  # RMS fallback when webrtcvad is not installed
+VAD_PAD_MS = 200  # Audio kept around voiced frames so word edges aren't clipped
+SILENCE_RMS = 0.003  # Clips quieter than this overall skip the VAD and the model
+
 # Global flag for handling interruption
 running = True
 
+# Shared PortAudio instance; initializing PortAudio enumerates every sound device
+_PA = None
+
+def get_pa():
+    """Return the shared PyAudio instance, creating it on first use"""
+    global _PA
+    if _PA is None:
+        _PA = pyaudio.PyAudio()
+    return _PA
+
+def terminate_pa():
+    """Release the shared PyAudio instance, if one was created"""
+    global _PA
+    if _PA is not None:
+        _PA.terminate()
+        _PA = None
+
 def signal_handler(sig, frame):
     """Handle Ctrl+C gracefully"""
     global running
@@ -50,18 +113,34 @@ def signal_handler(sig, frame):
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description="Whisper Dictation Tool")
-    parser.add_argument("--model", default="small", choices=["tiny", "base", "small", "medium", "large", "turbo"],
+    parser.add_argument("--model", default="small", choices=VALID_MODELS,
                         help="Whisper model size (smaller=faster, larger=more accurate)")
+    parser.add_argument("--precision", default=None, choices=["fp32", "fp16", "int8"],
+                        help="Model precision (default: int8 with faster-whisper; otherwise fp16 on CUDA, fp32 on CPU)")
+    parser.add_argument("--int8", dest="precision", action="store_const", const="int8",
+                        help="Shorthand for --precision int8")
+    parser.add_argument("--backend", default="auto", choices=["auto", "whisper", "faster-whisper"],
+                        help="Inference backend (default: faster-whisper if installed, it runs several times faster)")
+    parser.add_argument("--num-threads", type=int, default=None,
+                        help="CPU threads for inference (default: number of physical cores)")
+    parser.add_argument("--compile", action="store_true",
+                        help="Compile the model with torch.compile on CUDA (slow startup, faster decoding)")
     parser.add_argument("--language", default=None, 
-                        help="Language code (e.g., en, es, fr) or 'auto' for auto-detection")
+                        help="Language code (e.g., en, es, fr) or 'auto' to detect it from the first recording")
     parser.add_argument("--save", default=None, 
                         help="Save transcription to specified file")
     parser.add_argument("--continuous", action="store_true",
                         help="Continuous dictation mode (keeps recording until stopped)")
     parser.add_argument("--duration", type=int, default=10,
                         help="Recording duration in seconds (default: 10)")
+    parser.add_argument("--batch-size", type=int, default=1,
+                        help="Recordings to transcribe together in interactive continuous mode (default: 1)")
     parser.add_argument("--skip-check", action="store_true",
                         help="Skip microphone volume check")
+    parser.add_argument("--no-vad", action="store_true",
+                        help="Transcribe every recording, even ones the voice activity check finds silent")
+    parser.add_argument("--silence-rms", type=float, default=SILENCE_RMS,
+                        help=f"Skip continuous-mode chunks whose overall RMS level is below this (default: {SILENCE_RMS}, 0 disables)")
     parser.add_argument("--clipboard", action="store_true", default=True,
                         help="Automatically copy transcription to clipboard")
     parser.add_argument("--autopaste", action="store_true",
@@ -77,15 +156,231 @@ def parse_arguments():
     
     args = parser.parse_args()
     
+    if args.batch_size < 1:
+        parser.error("--batch-size must be a positive number")
+    
     # If --no-spacebar is specified, disable spacebar mode
     if args.no_spacebar:
         args.spacebar = False
     
     return args
 
+class FasterWhisperModel:
+    """Adapter exposing a faster-whisper (CTranslate2) model through whisper's transcribe() API"""
+    
+    COMPUTE_TYPES = {"fp32": "float32", "fp16": "float16", "int8": "int8"}
+    
+    def __init__(self, name, device="cpu", precision="int8"):
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            print("faster-whisper not found. Please install with:")
+            print("pip install faster-whisper")
+            sys.exit(1)
+        
+        # On CUDA, keep int8 weights but run the activations in float16
+        compute_type = self.COMPUTE_TYPES[precision]
+        if compute_type == "int8" and device == "cuda":
+            compute_type = "int8_float16"
+        
+        self.model = WhisperModel(name, device=device, compute_type=compute_type,
+                                  cpu_threads=torch.get_num_threads())
+    
+    def transcribe(self, audio, language=None, fp16=None, **kwargs):
+        """Transcribe audio and return a whisper-style result dict"""
+        # fp16 is fixed by the compute type at load time, so it is ignored here.
+        # vad_filter drops silent stretches Whisper tends to hallucinate on.
+        kwargs.setdefault("vad_filter", True)
+        segments, info = self.model.transcribe(audio, language=language, beam_size=1, **kwargs)
+        text = " ".join(segment.text.strip() for segment in segments)
+        return {"text": text, "language": info.language}
+
+def select_backend(backend="auto"):
+    """Resolve the 'auto' backend to faster-whisper when it is installed"""
+    if backend != "auto":
+        return backend
+    return "faster-whisper" if importlib.util.find_spec("faster_whisper") else "whisper"
+
+def cuda_available(backend="whisper"):
+    """Check whether the backend can run on a CUDA GPU"""
+    if backend == "faster-whisper":
+        # CTranslate2 ships its own CUDA build, which may be paired with a CPU-only torch
+        try:
+            import ctranslate2
+        except ImportError:
+            return False
+        return ctranslate2.get_cuda_device_count() > 0
+    return torch.cuda.is_available()
+
+def select_device(precision=None, backend="whisper"):
+    """Pick the device and precision to run the model with"""
+    cuda = cuda_available(backend)
+    
+    if precision is None:
+        if backend == "faster-whisper":
+            # CTranslate2's fused int8 GEMMs are its fastest path on CPU and GPU alike
+            precision = "int8"
+        else:
+            precision = "fp16" if cuda else "fp32"
+    
+    if precision == "int8" and backend == "whisper":
+        # Dynamic int8 quantization in PyTorch only has CPU kernels
+        if cuda:
+            print("int8 precision runs on CPU; ignoring the available GPU")
+        return "cpu", "int8"
+    
+    if precision == "fp16" and not cuda:
+        print("FP16 is not supported on CPU; using FP32 instead")
+        precision = "fp32"
+    
+    return ("cuda" if cuda else "cpu"), precision
+
+def load_whisper_model(name, device="cpu", precision="fp32", backend="whisper", compile_model=False):
+    """Load a Whisper model, quantizing it for int8 and compiling it if asked"""
+    if backend == "faster-whisper":
+        if compile_model:
+            print("--compile only applies to the whisper backend; skipping compilation")
+        return FasterWhisperModel(name, device, precision)
+    
+    model = whisper.load_model(name, device=device)
+    
+    if compile_model:
+        if device == "cuda" and hasattr(torch, "compile"):
+            model.encoder = torch.compile(model.encoder, mode="reduce-overhead")
+            model.decoder = torch.compile(model.decoder, mode="reduce-overhead")
+            print("Compiling model (this can take a minute)...")
+            silence = np.zeros(whisper.audio.N_SAMPLES, dtype=np.float32)
+            decode_features(model, compute_features(model, silence), fp16=(precision == "fp16"))
+        else:
+            print("torch.compile needs a CUDA GPU and PyTorch 2.0+; skipping compilation")
+    
+    if precision == "int8":
+        # quantize_dynamic only swaps modules whose type is exactly nn.Linear, so
+        # strip whisper's Linear subclass (it only adds dtype casting) first
+        for module in model.modules():
+            if isinstance(module, torch.nn.Linear):
+                module.__class__ = torch.nn.Linear
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    
+    return model
+
+@torch.inference_mode()
+def warm_up(model, language=None, fp16=False):
+    """Transcribe a short silent clip so lazy CUDA and CTranslate2 setup happens at startup"""
+    # faster-whisper's VAD would drop the silence before it ever reached the encoder
+    kwargs = {"vad_filter": False} if isinstance(model, FasterWhisperModel) else {}
+    model.transcribe(np.zeros(RATE * 2, dtype=np.float32), language=language, fp16=fp16, **kwargs)
+
+@numba.njit(cache=True)
+def max_abs_i16(samples):
+    """Peak absolute amplitude of int16 PCM, in one compiled pass with no temporaries"""
+    peak = 0
+    for sample in samples:
+        # Widen before negating so -32768 does not wrap around
+        magnitude = -int(sample) if sample < 0 else int(sample)
+        if magnitude > peak:
+            peak = magnitude
+    return peak
+
+def trim_silence(audio, rate=16000):
+    """Cut the silent stretches out of a float32 recording, or return an empty array if it has too little speech"""
+    frame_length = rate * VAD_FRAME_MS // 1000
+    num_frames = len(audio) // frame_length
+    frames = audio[:num_frames * frame_length].reshape(num_frames, frame_length)
+    
+    if webrtcvad is not None:
+        vad = webrtcvad.Vad(2)
+        pcm = (np.clip(frames, -1.0, 1.0) * 32767).astype(np.int16)
+        voiced = np.array([vad.is_speech(frame.tobytes(), rate) for frame in pcm], dtype=bool)
+    else:
+        voiced = np.sqrt(np.mean(np.square(frames), axis=1)) > VAD_ENERGY_THRESHOLD
+    
+    if np.count_nonzero(voiced) < VAD_MIN_VOICED_FRAMES:
+        return audio[:0]
+    
+    # Widen every voiced frame by the padding, then join the kept spans. "same"
+    # mode would return max(num_frames, kernel) values, so slice "full" instead.
+    pad = VAD_PAD_MS // VAD_FRAME_MS
+    keep = np.convolve(voiced, np.ones(2 * pad + 1), mode="full")[pad:pad + num_frames] > 0
+    return frames[keep].reshape(-1)
+
+def prepare_chunk(audio, silence_rms=SILENCE_RMS, vad=True):
+    """Drop a near-silent continuous-mode chunk by its overall RMS level, then trim its silence"""
+    # Whole-clip RMS falls as a recording gets longer, so only fixed-duration chunks use this gate
+    if len(audio) == 0 or np.sqrt(np.dot(audio, audio) / len(audio)) < silence_rms:
+        return audio[:0]
+    return trim_silence(audio) if vad else audio
+
+def compute_features(model, audio):
+    """Compute the log-Mel input for a recording that fits in one 30-second window, or None"""
+    # faster-whisper models and longer recordings go through transcribe() instead
+    if not isinstance(model, whisper.Whisper) or len(audio) > whisper.audio.N_SAMPLES:
+        return None
+    # On CUDA the recording goes up through the pinned buffer and the STFT runs there
+    return whisper.log_mel_spectrogram(whisper.pad_or_trim(stage_audio(model, audio)),
+                                       model.dims.n_mels)
+
+@torch.inference_mode()
+def decode_features(model, mel, language=None, fp16=False):
+    """Decode a log-Mel window, or a batch of them, into whisper-style result dicts"""
+    options = whisper.DecodingOptions(language=language, fp16=fp16, without_timestamps=True)
+    decoded = whisper.decode(model, mel.to(model.device), options)
+    
+    results = []
+    for result in (decoded if mel.ndim == 3 else [decoded]):
+        # Drop windows Whisper itself considers silent, as transcribe() does
+        silent = result.no_speech_prob > 0.6 and result.avg_logprob < -1.0
+        results.append({"text": "" if silent else result.text, "language": result.language})
+    
+    return results if mel.ndim == 3 else results[0]
+
+class Transcriber:
+    """Transcribes recordings with one model, reusing the first detected language"""
+    
+    def __init__(self, model, language=None, fp16=False):
+        self.model = model
+        self.fp16 = fp16
+        self._set_language(language)
+    
+    def _set_language(self, language):
+        self.language = language
+        # Recordings are independent utterances, so don't prompt with the previous text
+        self._transcribe = partial(self.model.transcribe, language=language, fp16=self.fp16,
+                                   task="transcribe", condition_on_previous_text=False)
+    
+    def _remember_language(self, result):
+        # Silent results carry a guessed language, so only trust ones with text
+        if self.language is None and result.get("language") and result["text"].strip():
+            self._set_language(result["language"])
+    
+    @torch.inference_mode()
+    def transcribe(self, audio, mel=None):
+        """Transcribe one recording, decoding its log-Mel window directly when it has one"""
+        if mel is None:
+            mel = compute_features(self.model, audio)
+        if mel is not None:
+            result = decode_features(self.model, mel, language=self.language, fp16=self.fp16)
+        else:
+            result = self._transcribe(stage_audio(self.model, audio))
+        
+        self._remember_language(result)
+        return result
+    
+    @torch.inference_mode()
+    def transcribe_batch(self, clips):
+        """Transcribe several recordings, decoding them as one batch when they allow it"""
+        mels = [compute_features(self.model, clip) for clip in clips]
+        if len(clips) > 1 and all(mel is not None for mel in mels):
+            results = decode_features(self.model, torch.stack(mels), language=self.language, fp16=self.fp16)
+            for result in results:
+                self._remember_language(result)
+            return results
+        
+        return [self.transcribe(clip) for clip in clips]
+
 def list_microphones():
     """List all available microphones"""
-    audio = pyaudio.PyAudio()
+    audio = get_pa()
     info = audio.get_host_api_info_by_index(0)
     num_devices = info.get('deviceCount')
     
@@ -99,57 +394,192 @@ def list_microphones():
             print(f"  [{i}] {name}")
             mic_list.append(i)
     
-    audio.terminate()
     return mic_list
 
-def check_microphone_volume(device_index=None, duration=3):
-    """Test the microphone volume to ensure it's working properly"""
-    FORMAT = pyaudio.paInt16
-    CHANNELS = 1
-    RATE = 16000
-    CHUNK = 1024
+def open_input_stream(device_index=None, rate=RATE, stream_callback=None, start=True):
+    """Open a microphone input stream, falling back to the default microphone"""
+    audio = get_pa()
     
-    print(f"Testing microphone volume for {duration} seconds...")
-    print("Please speak normally...")
-    
-    audio = pyaudio.PyAudio()
-    
-    # Open the stream
+    # Open the stream - with specified device if provided
     if device_index is not None:
         try:
             stream = audio.open(format=FORMAT, channels=CHANNELS,
-                            rate=RATE, input=True, input_device_index=device_index,
-                            frames_per_buffer=CHUNK)
+                            rate=rate, input=True, input_device_index=device_index,
+                            frames_per_buffer=CHUNK, stream_callback=stream_callback,
+                            start=start)
+            print(f"Using microphone: {audio.get_device_info_by_index(device_index)['name']}")
+            return stream
         except Exception as e:
             print(f"Error using selected microphone: {e}")
             print("Falling back to default microphone")
-            stream = audio.open(format=FORMAT, channels=CHANNELS,
-                            rate=RATE, input=True,
-                            frames_per_buffer=CHUNK)
-    else:
-        stream = audio.open(format=FORMAT, channels=CHANNELS,
-                        rate=RATE, input=True,
-                        frames_per_buffer=CHUNK)
-    
-    # Read audio data and check volume
-    max_volume = 0
-    for i in range(0, int(RATE / CHUNK * duration)):
-        data = stream.read(CHUNK, exception_on_overflow=False)
-        samples = np.frombuffer(data, dtype=np.int16)
-        max_sample = np.max(np.abs(samples))
-        max_volume = max(max_volume, max_sample)
+    
+    return audio.open(format=FORMAT, channels=CHANNELS,
+                      rate=rate, input=True,
+                      frames_per_buffer=CHUNK, stream_callback=stream_callback,
+                      start=start)
+
+class CaptureBuffer:
+    """Preallocated int16 buffer that a PyAudio stream callback records into, optionally as a ring"""
+    
+    def __init__(self, max_samples):
+        self.samples = np.empty(max_samples, dtype=np.int16)
+        self.filled = 0
+        self.limit = max_samples
+        self.ring = False
+        self.full = threading.Event()
+    
+    def reset(self, limit=None, ring=False):
+        """Empty the buffer, growing it if `limit` samples would not fit"""
+        if limit is not None and limit > len(self.samples):
+            self.samples = np.empty(limit, dtype=np.int16)
+        self.limit = len(self.samples) if limit is None else limit
+        self.ring = ring
+        self.filled = 0
+        self.full.clear()
+    
+    def callback(self, in_data, frame_count, time_info, status):
+        """PyAudio stream callback; completes the stream once `limit` samples are captured"""
+        chunk = np.frombuffer(in_data, dtype=np.int16)
+        if self.ring:
+            pos = self.filled % len(self.samples)
+            head = min(len(chunk), len(self.samples) - pos)
+            self.samples[pos:pos + head] = chunk[:head]
+            self.samples[:len(chunk) - head] = chunk[head:]
+            self.filled += len(chunk)
+            return (None, pyaudio.paContinue)
+        
+        chunk = chunk[:self.limit - self.filled]
+        self.samples[self.filled:self.filled + len(chunk)] = chunk
+        self.filled += len(chunk)
+        if self.filled < self.limit:
+            return (None, pyaudio.paContinue)
+        self.full.set()
+        return (None, pyaudio.paComplete)
+    
+    def audio(self, start=0, stop=None):
+        """Return captured samples [start, stop) as float32; ring positions wrap around the buffer"""
+        stop = self.filled if stop is None else stop
+        size = len(self.samples)
+        offset = start % size
+        head = min(stop - start, size - offset)
+        
+        # Convert straight into the output and scale in place with a multiply,
+        # avoiding a divide and any temporaries
+        audio = np.empty(stop - start, dtype=np.float32)
+        audio[:head] = self.samples[offset:offset + head]
+        audio[head:] = self.samples[:stop - start - head]
+        audio *= 1.0 / 32768.0
+        return audio
+
+class RecordingSession:
+    """One microphone stream, opened once and only started while recording"""
+    
+    def __init__(self, device_index=None, max_duration=60):
+        self.capture = CaptureBuffer(RATE * max_duration)
+        self.stream = open_input_stream(device_index, stream_callback=self.capture.callback, start=False)
+    
+    def start(self, duration=None):
+        """Start capturing, for at most `duration` seconds if given"""
+        self.capture.reset(None if duration is None else int(RATE * duration))
+        self.stream.start_stream()
+    
+    def stop(self):
+        """Pause the stream and return the recording as a float32 numpy array"""
+        self.stream.stop_stream()
+        return self.capture.audio()
+    
+    def record(self, duration=5):
+        """Record `duration` seconds; returns a float32 numpy array sampled at RATE"""
+        print(f"Recording for {duration} seconds...")
+        self.start(duration)
+        
+        # The callback fills the buffer; wake up periodically so Ctrl+C is noticed
+        while running and not self.capture.full.wait(timeout=0.1):
+            pass
+        
+        return self.stop()
+    
+    def record_chunks(self, duration, stop_event=None):
+        """Yield back-to-back `duration`-second recordings from the running stream until stopped"""
+        stop_event = stop_event or threading.Event()
+        step = int(RATE * duration)
+        self.capture.reset(RING_CHUNKS * step, ring=True)
+        self.stream.start_stream()
+        
+        try:
+            start = 0
+            while running and not stop_event.is_set():
+                print(f"Recording for {duration} seconds...")
+                while self.capture.filled < start + step:
+                    if stop_event.wait(timeout=0.1) or not running:
+                        return
+                
+                # Stay a chunk clear of where the callback is writing
+                start = max(start, self.capture.filled + step - len(self.capture.samples))
+                yield self.capture.audio(start, start + step)
+                start += step
+        finally:
+            self.stream.stop_stream()
+    
+    def close(self):
+        self.stream.close()
+
+# Page-locked host buffer reused to copy recordings to the GPU, and the CUDA
+# event marking when its last asynchronous copy finished reading it
+_PINNED = None
+_PINNED_READ = None
+
+def stage_audio(model, audio):
+    """Copy a recording to a CUDA whisper model's device through a reused pinned buffer"""
+    global _PINNED, _PINNED_READ
+    # Other models, and audio that is already staged, are returned unchanged
+    if (not isinstance(model, whisper.Whisper) or model.device.type != "cuda"
+            or isinstance(audio, torch.Tensor)):
+        return audio
+    
+    # Don't overwrite the buffer while the previous copy may still be reading it
+    if _PINNED_READ is not None:
+        _PINNED_READ.synchronize()
+    
+    if _PINNED is None or len(_PINNED) < len(audio):
+        _PINNED = torch.empty(max(len(audio), RATE * 30), dtype=torch.float32).pin_memory()
+    
+    staged = _PINNED[:len(audio)]
+    staged.copy_(torch.from_numpy(audio))
+    audio = staged.to(model.device, non_blocking=True)
+    _PINNED_READ = torch.cuda.Event()
+    _PINNED_READ.record()
+    return audio
+
+def check_microphone_volume(session, duration=3):
+    """Test the microphone volume to ensure it's working properly"""
+    print(f"Testing microphone volume for {duration} seconds...")
+    print("Please speak normally...")
+    
+    capture = session.capture
+    session.start(duration)
+    
+    # Meter the latest tenth of a second the callback has captured
+    step = RATE // 10
+    metered = 0
+    while running and not capture.full.is_set():
+        capture.full.wait(timeout=0.1)
+        filled = capture.filled - capture.filled % step
+        if filled == metered:
+            continue
+        max_sample = max_abs_i16(capture.samples[filled - step:filled])
+        metered = filled
         
         # Display a simple volume meter
         vol_percent = min(100, int(max_sample / 32768 * 100))
         meter = "█" * int(vol_percent / 5)
         sys.stdout.write(f"\rVolume: {meter.ljust(20)} {vol_percent}%")
         sys.stdout.flush()
-        time.sleep(0.1)
     
-    # Close the stream
-    stream.stop_stream()
-    stream.close()
-    audio.terminate()
+    session.stop()
+    
+    # Judge the volume with a single reduction over the whole recording
+    max_volume = max_abs_i16(capture.samples[:capture.filled])
     
     print("\n")
     
@@ -168,61 +598,22 @@ def check_microphone_volume(device_index=None, duration=3):
     
     return True
 
-def record_until_shift_spacebar(device_index=None, rate=16000, max_duration=60):
-    """Record audio from microphone until Shift+Spacebar is pressed or max duration is reached"""
-    global running
-    # Audio parameters
-    FORMAT = pyaudio.paInt16
-    CHANNELS = 1
-    CHUNK = 1024
-    
+def record_until_shift_spacebar(session, stop_event, max_duration=60):
+    """Record audio from microphone until `stop_event` is set or max duration is reached"""
     print("🔴 Recording... (Press SHIFT+SPACEBAR to stop)")
     
-    # Initialize PyAudio
-    audio = pyaudio.PyAudio()
-    
-    # Start recording - with specified device if provided
-    if device_index is not None:
-        try:
-            stream = audio.open(format=FORMAT, channels=CHANNELS,
-                            rate=rate, input=True, input_device_index=device_index,
-                            frames_per_buffer=CHUNK)
-            print(f"Using microphone: {audio.get_device_info_by_index(device_index)['name']}")
-        except Exception as e:
-            print(f"Error using selected microphone: {e}")
-            print("Falling back to default microphone")
-            stream = audio.open(format=FORMAT, channels=CHANNELS,
-                            rate=rate, input=True,
-                            frames_per_buffer=CHUNK)
-    else:
-        stream = audio.open(format=FORMAT, channels=CHANNELS,
-                        rate=rate, input=True,
-                        frames_per_buffer=CHUNK)
+    # PortAudio delivers captured chunks to the callback from its own thread,
+    # so capture keeps running while this thread waits for the hotkey
+    session.start(max_duration)
     
-    frames = []
     start_time = time.time()
     elapsed_time = 0
-    last_check = 0
-    
-    # Record until Shift+Spacebar is pressed or max duration is reached
-    while elapsed_time < max_duration and running:
-        # Only check keyboard every 0.1 seconds to reduce CPU usage
-        current_time = time.time()
-        if current_time - last_check >= 0.1:
-            if keyboard.is_pressed('shift') and keyboard.is_pressed('space'):
-                # Small delay to avoid multiple triggers
-                time.sleep(0.3)
-                break
-                
-            # Also check for ESC key
-            if keyboard.is_pressed('esc'):
-                running = False
-                break
-                
-            last_check = current_time
-            
-        data = stream.read(CHUNK, exception_on_overflow=False)
-        frames.append(data)
+    
+    # Record until Shift+Spacebar is pressed or max duration is reached. The
+    # callback does the capturing, so this thread only sleeps on the event.
+    while elapsed_time < max_duration and running and not session.capture.full.is_set():
+        if stop_event.wait(timeout=0.1):
+            break
         
         elapsed_time = time.time() - start_time
         
@@ -231,76 +622,95 @@ def record_until_shift_spacebar(device_index=None, rate=16000, max_duration=60):
             sys.stdout.write(f"\rRecording: {int(elapsed_time)}s ")
             sys.stdout.flush()
     
-    # Stop and close recording
-    stream.stop_stream()
-    stream.close()
-    audio.terminate()
+    # Pause the stream until the next recording
+    audio = session.stop()
     
     # Calculate actual duration
     actual_duration = time.time() - start_time
     print(f"\n✅ Recording stopped after {actual_duration:.1f} seconds")
     
-    # Save to a temporary WAV file
-    temp_file = tempfile.mktemp(suffix=".wav")
-    with wave.open(temp_file, 'wb') as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(audio.get_sample_size(FORMAT))
-        wf.setframerate(rate)
-        wf.writeframes(b''.join(frames))
-    
-    return temp_file
+    return audio
 
-def record_audio(duration=5, rate=16000, device_index=None):
-    """Record audio from microphone"""
-    # Audio parameters
-    FORMAT = pyaudio.paInt16
-    CHANNELS = 1
-    CHUNK = 1024
-    
-    print(f"Recording for {duration} seconds...")
+def wait_for_paste(delay):
+    """Wait until the user presses Space, or at most `delay` seconds, before auto-pasting"""
+    # Suppress the Space press so it isn't typed into the target window
+    ready = threading.Event()
+    try:
+        hotkey = keyboard.add_hotkey('space', ready.set, suppress=True)
+    except Exception:
+        # Global hooks need root on Linux and accessibility access on macOS
+        time.sleep(delay)
+        return
     
-    # Initialize PyAudio
-    audio = pyaudio.PyAudio()
+    try:
+        ready.wait(timeout=delay)
+    finally:
+        keyboard.remove_hotkey(hotkey)
+
+def _paste_macos():
+    subprocess.run(["osascript", "-e",
+                    'tell application "System Events" to keystroke "v" using command down'],
+                   check=True)
+
+def _paste_windows():
+    import ctypes
+    VK_CONTROL, VK_V, KEYEVENTF_KEYUP = 0x11, 0x56, 0x0002
+    keybd_event = ctypes.windll.user32.keybd_event
+    keybd_event(VK_CONTROL, 0, 0, 0)
+    keybd_event(VK_V, 0, 0, 0)
+    keybd_event(VK_V, 0, KEYEVENTF_KEYUP, 0)
+    keybd_event(VK_CONTROL, 0, KEYEVENTF_KEYUP, 0)
+
+def _paste_x11():
+    # Requires python-xlib and an X11 (or XWayland) display
+    from Xlib import X, XK, display
+    from Xlib.ext import xtest
     
-    # Start recording - with specified device if provided
-    if device_index is not None:
+    d = display.Display()
+    try:
+        ctrl = d.keysym_to_keycode(XK.string_to_keysym("Control_L"))
+        v = d.keysym_to_keycode(XK.string_to_keysym("v"))
+        xtest.fake_input(d, X.KeyPress, ctrl)
+        xtest.fake_input(d, X.KeyPress, v)
+        xtest.fake_input(d, X.KeyRelease, v)
+        xtest.fake_input(d, X.KeyRelease, ctrl)
+        d.sync()
+    finally:
+        d.close()
+
+def _paste_xdotool():
+    subprocess.run(["xdotool", "key", "--clearmodifiers", "ctrl+v"], check=True)
+
+def _select_paste_fn():
+    """Pick the native paste route for this platform, or None to use pyautogui"""
+    if sys.platform == "darwin":
+        return _paste_macos
+    if sys.platform == "win32":
+        return _paste_windows
+    if importlib.util.find_spec("Xlib"):
+        return _paste_x11
+    if shutil.which("xdotool"):
+        return _paste_xdotool
+    return None
+
+# Chosen once at startup; reset to None if the native route turns out not to work
+_paste_fn = _select_paste_fn()
+
+def paste_clipboard():
+    """Paste the clipboard where the cursor is, preferring the native input API over pyautogui"""
+    global _paste_fn
+    if _paste_fn is not None:
         try:
-            stream = audio.open(format=FORMAT, channels=CHANNELS,
-                            rate=rate, input=True, input_device_index=device_index,
-                            frames_per_buffer=CHUNK)
-            print(f"Using microphone: {audio.get_device_info_by_index(device_index)['name']}")
-        except Exception as e:
-            print(f"Error using selected microphone: {e}")
-            print("Falling back to default microphone")
-            stream = audio.open(format=FORMAT, channels=CHANNELS,
-                            rate=rate, input=True,
-                            frames_per_buffer=CHUNK)
-    else:
-        stream = audio.open(format=FORMAT, channels=CHANNELS,
-                        rate=rate, input=True,
-                        frames_per_buffer=CHUNK)
-    
-    frames = []
-    for i in range(0, int(rate / CHUNK * duration)):
-        if not running:
-            break
-        data = stream.read(CHUNK, exception_on_overflow=False)
-        frames.append(data)
-    
-    # Stop and close recording
-    stream.stop_stream()
-    stream.close()
-    audio.terminate()
-    
-    # Save to a temporary WAV file
-    temp_file = tempfile.mktemp(suffix=".wav")
-    with wave.open(temp_file, 'wb') as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(audio.get_sample_size(FORMAT))
-        wf.setframerate(rate)
-        wf.writeframes(b''.join(frames))
+            _paste_fn()
+            return
+        except Exception:
+            _paste_fn = None
     
-    return temp_file
+    # Detect platform and use appropriate paste command
+    if sys.platform == "darwin":  # macOS
+        pyautogui.hotkey('command', 'v')
+    else:  # Windows/Linux
+        pyautogui.hotkey('ctrl', 'v')
 
 def display_interactive_help():
     """Display help for interactive mode"""
@@ -310,16 +720,18 @@ def display_interactive_help():
     print("  language [code]    - Set language (e.g., 'en', 'es', 'fr', or 'auto')")
     print("  clipboard on/off   - Toggle copying to clipboard")
     print("  autopaste on/off   - Toggle auto-pasting")
-    print("  delay [seconds]    - Set delay before auto-pasting")
+    print("  delay [seconds]    - Set maximum delay before auto-pasting (SPACE pastes sooner)")
     print("  model [name]       - Change model (tiny, base, small, medium, large, turbo)")
+    print("  unload            - Free cached models other than the current one")
     print("  save [filename]    - Set file to save transcriptions (or 'off' to disable)")
     print("  duration [seconds] - Set default recording duration")
+    print("  batch [size]       - Set how many continuous recordings are transcribed together")
     print("  status            - Show current settings")
     print("  help              - Show this help")
     print("  exit/quit         - Exit the program")
     print("================================\n")
 
-def run_spacebar_mode(model, args, device_index=None):
+def run_spacebar_mode(model, args, session):
     """Run dictation with Shift+Spacebar control"""
     print("\n=== Whisper Dictation Tool (Shift+Spacebar Mode) ===")
     print("Press SHIFT+SPACEBAR to START recording")
@@ -330,10 +742,77 @@ def run_spacebar_mode(model, args, device_index=None):
     # Open output file if specified
     output_file = None
     if args.save:
-        output_file = open(args.save, "w", encoding="utf-8")
+        output_file = open(args.save, "w", encoding="utf-8", buffering=1)
     
     # Prepare language setting
     language = None if args.language == "auto" else args.language
+    transcriber = Transcriber(model, language, fp16=(args.precision == "fp16"))
+    
+    def prepare(audio):
+        """Trim silence and compute the log-Mel input (runs on the feature worker)"""
+        if not args.no_vad:
+            audio = trim_silence(audio)
+        if len(audio) == 0:
+            return audio, None
+        
+        # Stage long recordings here too, so only this worker touches the pinned buffer
+        features = compute_features(model, audio)
+        return (audio if features is not None else stage_audio(model, audio)), features
+    
+    def transcribe_and_output(prepared):
+        """Transcribe one prepared recording and deliver the text (runs on the transcription worker)"""
+        try:
+            audio, features = prepared.result()
+            if len(audio) == 0:
+                print("🔇 No speech detected")
+                return
+            
+            result = transcriber.transcribe(audio, features)
+        except Exception as e:
+            print(f"Error: {e}")
+            return
+        
+        # Output result
+        transcription = result["text"].strip()
+        if transcription:
+            print(f"\n📝 Transcription:\n{transcription}\n")
+            
+            # Save to file if specified
+            if output_file:
+                output_file.write(f"{transcription}\n")
+            
+            # Always copy to clipboard for convenience
+            pyperclip.copy(transcription)
+            print("📋 Copied to clipboard! (Press Ctrl+V to paste)")
+            
+            # Auto-paste if requested
+            if args.autopaste:
+                print(f"🖱️ Auto-pasting in {args.delay} seconds... (Move cursor to desired location, SPACE to paste now)")
+                wait_for_paste(args.delay)
+                paste_clipboard()
+                print("✅ Pasted!")
+    
+    # A single worker keeps transcriptions in order while overlapping them with
+    # recording; a second one computes the next recording's features meanwhile
+    executor = ThreadPoolExecutor(max_workers=1)
+    feature_executor = ThreadPoolExecutor(max_workers=1)
+    
+    # Hotkeys arrive on keyboard's listener thread; this thread sleeps on the
+    # events instead of polling key state. Triggering on release avoids
+    # repeated toggles from key auto-repeat.
+    toggle_event = threading.Event()
+    exit_event = threading.Event()
+    
+    def request_exit():
+        exit_event.set()
+        toggle_event.set()  # Wake up whatever is waiting on the toggle
+    
+    hotkeys = [
+        keyboard.add_hotkey('shift+space', toggle_event.set, trigger_on_release=True),
+        keyboard.add_hotkey('esc', request_exit),
+    ]
+    
+    max_duration = 60
     
     try:
         # Main dictation loop
@@ -341,104 +820,49 @@ def run_spacebar_mode(model, args, device_index=None):
             # Wait for shift+spacebar to start recording
             print("⏸️  Ready - Press SHIFT+SPACEBAR to start recording...")
             
-            # Wait until shift+spacebar is pressed with timeout to allow for interruption
-            start_wait = time.time()
-            while True:
-                # Check for interrupt every iteration with short timeout
-                if not running:  # Global flag set by signal handler
-                    print("Exiting...")
-                    return
-                
-                if keyboard.is_pressed('shift') and keyboard.is_pressed('space'):
-                    # Small delay to avoid multiple triggers
-                    time.sleep(0.3)
-                    break
-                elif keyboard.is_pressed('esc'):
+            # Wake up periodically so Ctrl+C (the global flag) is noticed
+            while not toggle_event.wait(timeout=0.5):
+                if not running:
                     print("Exiting...")
                     return
-                
-                # Check if more than 0.5 seconds has passed
-                if time.time() - start_wait > 0.5:
-                    # Check if we need to exit
-                    if not running:
-                        print("Exiting...")
-                        return
-                    start_wait = time.time()
-                
-                # Short sleep to prevent high CPU usage
-                time.sleep(0.1)
+            toggle_event.clear()
             
-            # Check for ESC key
-            if keyboard.is_pressed('esc'):
+            if exit_event.is_set() or not running:
                 print("Exiting...")
-                break
+                return
             
             # Record until shift+spacebar is pressed again
-            audio_file = record_until_shift_spacebar(device_index=device_index, max_duration=60)
+            audio = record_until_shift_spacebar(session, toggle_event, max_duration=max_duration)
+            toggle_event.clear()
             
             # Check if we need to exit
-            if not running:
+            if exit_event.is_set() or not running:
                 print("Exiting...")
-                try:
-                    os.remove(audio_file)
-                except:
-                    pass
                 return
             
+            # Transcribe in the background so the next recording can start right away
             print("🔍 Transcribing...")
-            result = model.transcribe(
-                audio_file, 
-                language=language,
-                fp16=False
-            )
-            
-            # Output result
-            transcription = result["text"].strip()
-            if transcription:
-                print(f"\n📝 Transcription:\n{transcription}\n")
-                
-                # Save to file if specified
-                if output_file:
-                    output_file.write(f"{transcription}\n")
-                    output_file.flush()
-                
-                # Always copy to clipboard for convenience
-                pyperclip.copy(transcription)
-                print("📋 Copied to clipboard! (Press Ctrl+V to paste)")
-                
-                # Auto-paste if requested
-                if args.autopaste:
-                    print(f"🖱️ Auto-pasting in {args.delay} seconds... (Move cursor to desired location)")
-                    time.sleep(args.delay)
-                    # Detect platform and use appropriate paste command
-                    if sys.platform == "darwin":  # macOS
-                        pyautogui.hotkey('command', 'v')
-                    else:  # Windows/Linux
-                        pyautogui.hotkey('ctrl', 'v')
-                    print("✅ Pasted!")
-            
-            # Clean up
-            try:
-                os.remove(audio_file)
-            except:
-                pass
-            
-            # Check if we need to exit
-            if not running:
-                print("Exiting...")
-                return
+            prepared = feature_executor.submit(prepare, audio)
+            executor.submit(transcribe_and_output, prepared)
     
     except KeyboardInterrupt:
         print("\nStopping dictation...")
     
     finally:
+        for hotkey in hotkeys:
+            keyboard.remove_hotkey(hotkey)
+        
+        # Let pending transcriptions finish before closing the output file
+        executor.shutdown(wait=True)
+        feature_executor.shutdown(wait=True)
+        
         # Close output file if opened
         if output_file:
             output_file.close()
             if args.save:
                 print(f"Transcriptions saved to {args.save}")
 
-def run_interactive_mode(model, args):
+def run_interactive_mode(model, args, session):
     """Run the dictation tool in interactive mode"""
     print("\n=== Whisper Dictation Tool (Interactive Mode) ===")
     print("Type 'help' for available commands or 'record' to start dictating")
@@ -447,35 +871,55 @@ def run_interactive_mode(model, args):
     # Initialize settings from args
     settings = {
         "model": args.model,
-        "language": args.language,
+        "language": None if args.language == "auto" else args.language,
         "save_file": args.save,
         "clipboard": args.clipboard,
         "autopaste": args.autopaste,
         "delay": args.delay,
         "duration": args.duration,
+        "batch_size": args.batch_size,
         "output_file": None
     }
     
     # Open output file if specified
     if settings["save_file"]:
-        settings["output_file"] = open(settings["save_file"], "w", encoding="utf-8")
-    
-    # Store device_index to avoid selecting microphone each time
-    device_index = None
+        settings["output_file"] = open(settings["save_file"], "w", encoding="utf-8", buffering=1)
     
-    # Initial mic selection
-    mic_list = list_microphones()
-    if len(mic_list) > 1:
-        try:
-            selection = input("\nSelect microphone number (or press Enter for default): ")
-            if selection.strip():
-                device_index = int(selection)
-        except ValueError:
-            print("Invalid selection, using default microphone")
+    # Recently used models, most recent last, so switching back skips the reload
+    model_cache = OrderedDict([(settings["model"], model)])
+    transcriber = Transcriber(model, settings["language"], fp16=(args.precision == "fp16"))
+    pending = deque()
     
-    # Check microphone volume unless skipped
-    if not args.skip_check:
-        check_microphone_volume(device_index)
+    def transcribe_pending():
+        """Transcribe the batched continuous-mode recordings and output the results"""
+        print("Transcribing...")
+        clips = list(pending)
+        pending.clear()
+        results = transcriber.transcribe_batch(clips)
+        
+        for result in results:
+            # Output
+            transcription = result["text"].strip()
+            timestamp = time.strftime("%H:%M:%S")
+            
+            if transcription:
+                print(f"[{timestamp}] {transcription}")
+                
+                # Save to file if specified
+                if settings["output_file"]:
+                    settings["output_file"].write(f"{transcription}\n")
+                
+                # Copy to clipboard if enabled
+                if settings["clipboard"] or settings["autopaste"]:
+                    pyperclip.copy(transcription)
+                    print("(Copied to clipboard)")
+                
+                # Auto-paste if enabled
+                if settings["autopaste"]:
+                    print(f"Auto-pasting in {settings['delay']} seconds... (SPACE to paste now)")
+                    wait_for_paste(settings["delay"])
+                    paste_clipboard()
+                    print("(Pasted)")
     
     # Main interactive loop
     try:
@@ -501,6 +945,7 @@ def run_interactive_mode(model, args):
                     print(f"  Model: {settings['model']}")
                     print(f"  Language: {settings['language'] or 'auto'}")
                     print(f"  Recording duration: {settings['duration']} seconds")
+                    print(f"  Continuous batch size: {settings['batch_size']}")
                     print(f"  Save to file: {settings['save_file'] or 'disabled'}")
                     print(f"  Copy to clipboard: {'enabled' if settings['clipboard'] else 'disabled'}")
                     print(f"  Auto-paste: {'enabled' if settings['autopaste'] else 'disabled'}")
@@ -515,14 +960,16 @@ def run_interactive_mode(model, args):
                     
                     # Record and transcribe
                     print(f"Recording for {duration} seconds...")
-                    audio_file = record_audio(duration=duration, device_index=device_index)
+                    audio = session.record(duration)
+                    
+                    if not args.no_vad:
+                        audio = trim_silence(audio)
+                    if len(audio) == 0:
+                        print("(No speech detected)")
+                        continue
                     
                     print("Transcribing...")
-                    result = model.transcribe(
-                        audio_file, 
-                        language=settings["language"],
-                        fp16=False
-                    )
+                    result = transcriber.transcribe(audio)
                     
                     # Output result
                     transcription = result["text"].strip()
@@ -532,7 +979,6 @@ def run_interactive_mode(model, args):
                         # Save to file if specified
                         if settings["output_file"]:
                             settings["output_file"].write(f"{transcription}\n")
-                            settings["output_file"].flush()
                         
                         # Copy to clipboard if enabled
                         if settings["clipboard"] or settings["autopaste"]:
@@ -541,75 +987,36 @@ def run_interactive_mode(model, args):
                         
                         # Auto-paste if enabled
                         if settings["autopaste"]:
-                            print(f"Auto-pasting in {settings['delay']} seconds... (Move cursor to desired location)")
-                            time.sleep(settings["delay"])
-                            # Detect platform and use appropriate paste command
-                            if sys.platform == "darwin":  # macOS
-                                pyautogui.hotkey('command', 'v')
-                            else:  # Windows/Linux
-                                pyautogui.hotkey('ctrl', 'v')
+                            print(f"Auto-pasting in {settings['delay']} seconds... (Move cursor to desired location, SPACE to paste now)")
+                            wait_for_paste(settings["delay"])
+                            paste_clipboard()
                             print("(Pasted)")
-                    
-                    # Clean up
-                    try:
-                        os.remove(audio_file)
-                    except:
-                        pass
                 
                 elif cmd == "continuous":
                     print("Starting continuous recording. Press Ctrl+C to stop...")
-                    continuous_running = True
                     
                     try:
-                        while continuous_running:
-                            # Record
-                            audio_file = record_audio(duration=settings["duration"], device_index=device_index)
-                            
-                            # Transcribe
-                            print("Transcribing...")
-                            result = model.transcribe(
-                                audio_file, 
-                                language=settings["language"],
-                                fp16=False
-                            )
+                        # Capture keeps running while earlier chunks are transcribed
+                        for audio in session.record_chunks(settings["duration"]):
+                            audio = prepare_chunk(audio, args.silence_rms, vad=not args.no_vad)
+                            if len(audio) == 0:
+                                print("[silence]")
+                                continue
                             
-                            # Output
-                            transcription = result["text"].strip()
-                            timestamp = datetime.now().strftime("%H:%M:%S")
+                            # Batch recordings so one encoder pass covers several of them
+                            pending.append(audio)
+                            if len(pending) < settings["batch_size"]:
+                                continue
                             
-                            if transcription:
-                                print(f"[{timestamp}] {transcription}")
-                                
-                                # Save to file if specified
-                                if settings["output_file"]:
-                                    settings["output_file"].write(f"{transcription}\n")
-                                    settings["output_file"].flush()
-                                
-                                # Copy to clipboard if enabled
-                                if settings["clipboard"] or settings["autopaste"]:
-                                    pyperclip.copy(transcription)
-                                    print("(Copied to clipboard)")
-                                
-                                # Auto-paste if enabled
-                                if settings["autopaste"]:
-                                    print(f"Auto-pasting in {settings['delay']} seconds...")
-                                    time.sleep(settings["delay"])
-                                    # Detect platform and use appropriate paste command
-                                    if sys.platform == "darwin":  # macOS
-                                        pyautogui.hotkey('command', 'v')
-                                    else:  # Windows/Linux
-                                        pyautogui.hotkey('ctrl', 'v')
-                                    print("(Pasted)")
-                            
-                            # Clean up
-                            try:
-                                os.remove(audio_file)
-                            except:
-                                pass
+                            transcribe_pending()
                     
                     except KeyboardInterrupt:
                         print("\nContinuous recording stopped")
-                        continuous_running = False
+                    
+                    finally:
+                        # Don't drop recordings still waiting for a full batch
+                        if pending:
+                            transcribe_pending()
                 
                 elif cmd == "language":
                     if arg in ["auto", ""]:
@@ -618,6 +1025,7 @@ def run_interactive_mode(model, args):
                     else:
                         settings["language"] = arg
                         print(f"Language set to: {arg}")
+                    transcriber = Transcriber(model, settings["language"], fp16=(args.precision == "fp16"))
                 
                 elif cmd == "clipboard":
                     if arg in ["on", "true", "yes", "1"]:
@@ -648,19 +1056,35 @@ def run_interactive_mode(model, args):
                         print(f"Invalid delay: {arg}. Please specify a number of seconds.")
                 
                 elif cmd == "model":
-                    valid_models = ["tiny", "base", "small", "medium", "large", "turbo"]
-                    if arg in valid_models:
+                    if arg in VALID_MODELS:
                         if arg != settings["model"]:
-                            print(f"Changing model to {arg}...")
                             settings["model"] = arg
-                            model = whisper.load_model(arg)
+                            if arg in model_cache:
+                                print(f"Changing model to {arg} (cached)...")
+                                model_cache.move_to_end(arg)
+                            else:
+                                print(f"Changing model to {arg}...")
+                                model_cache[arg] = load_whisper_model(arg, args.device, args.precision, args.backend,
+                                                                     compile_model=args.compile)
+                                if len(model_cache) > MODEL_CACHE_SIZE:
+                                    model_cache.popitem(last=False)
+                            model = model_cache[arg]
+                            transcriber = Transcriber(model, settings["language"], fp16=(args.precision == "fp16"))
                             print("Model loaded!")
                         else:
                             print(f"Model is already set to {arg}")
                     else:
-                        models_str = ", ".join(valid_models)
+                        models_str = ", ".join(VALID_MODELS)
                         print(f"Invalid model name: {arg}. Available models: {models_str}")
                 
+                elif cmd == "unload":
+                    freed = [name for name in model_cache if name != settings["model"]]
+                    for name in freed:
+                        del model_cache[name]
+                    if freed and args.device == "cuda":
+                        torch.cuda.empty_cache()
+                    print(f"Unloaded cached models: {', '.join(freed) or 'none'}")
+                
                 elif cmd == "save":
                     # Close existing file if open
                     if settings["output_file"]:
@@ -672,11 +1096,20 @@ def run_interactive_mode(model, args):
                         print("File saving disabled")
                     elif arg:
                         settings["save_file"] = arg
-                        settings["output_file"] = open(arg, "w", encoding="utf-8")
+                        settings["output_file"] = open(arg, "w", encoding="utf-8", buffering=1)
                         print(f"Saving transcriptions to: {arg}")
                     else:
                         print("Please specify a filename or 'off' to disable saving")
                 
+                elif cmd == "batch":
+                    if arg and arg.isdigit() and int(arg) > 0:
+                        settings["batch_size"] = int(arg)
+                        print(f"Continuous batch size set to {settings['batch_size']}")
+                        if isinstance(model, FasterWhisperModel) and settings["batch_size"] > 1:
+                            print("Note: faster-whisper transcribes batched recordings one at a time")
+                    else:
+                        print(f"Invalid batch size: {arg}. Please specify a positive number.")
+                
                 elif cmd == "duration":
                     if arg and arg.isdigit():
                         settings["duration"] = int(arg)
@@ -709,12 +1142,34 @@ def main():
     # Parse arguments
     args = parse_arguments()
     
+    # One intra-op thread per physical core; inter-op parallelism only adds contention
+    torch.set_num_threads(args.num_threads or physical_cpu_count())
+    torch.set_num_interop_threads(1)
+    
+    # Dictation only runs inference, so never record autograd history. Grad mode
+    # is per thread; model calls on worker threads run under inference_mode.
+    torch.set_grad_enabled(False)
+    
+    session = None
     try:
-        # Load model
-        print(f"Loading Whisper model '{args.model}'...")
-        model = whisper.load_model(args.model)
+        # Load model on the GPU when available
+        args.backend = select_backend(args.backend)
+        args.device, args.precision = select_device(args.precision, args.backend)
+        if args.backend == "faster-whisper" and args.batch_size > 1:
+            print("--batch-size only applies to the whisper backend; recordings will be transcribed one at a time")
+        print(f"Loading Whisper model '{args.model}' ({args.backend}, {args.precision} on {args.device})...")
+        model = load_whisper_model(args.model, args.device, args.precision, args.backend,
+                                   compile_model=args.compile)
         print("Model loaded!")
         
+        # Warm up in the background while the user picks a microphone and
+        # runs the volume check, so the first recording isn't slowed down
+        print("Warming up...")
+        warmup = threading.Thread(target=warm_up, daemon=True,
+                                  args=(model, None if args.language == "auto" else args.language,
+                                        args.precision == "fp16"))
+        warmup.start()
+        
         # List available microphones at startup
         device_index = None
         mic_list = list_microphones()
@@ -726,27 +1181,33 @@ def main():
             except ValueError:
                 print("Invalid selection, using default microphone")
         
+        # Open the microphone once; every mode records through this session
+        session = RecordingSession(device_index)
+        
         # Perform volume check unless skipped
         if not args.skip_check:
-            check_microphone_volume(device_index)
+            check_microphone_volume(session)
+        
+        warmup.join()
         
         # Check if running in spacebar mode (default)
         if args.spacebar:
-            run_spacebar_mode(model, args, device_index)
+            run_spacebar_mode(model, args, session)
             return
         
         # Check if running in interactive mode
         if args.interactive:
-            run_interactive_mode(model, args)
+            run_interactive_mode(model, args, session)
             return
         
         # Prepare language setting
         language = None if args.language == "auto" else args.language
+        transcriber = Transcriber(model, language, fp16=(args.precision == "fp16"))
         
         # Open output file if specified
         output_file = None
         if args.save:
-            output_file = open(args.save, "w", encoding="utf-8")
+            output_file = open(args.save, "w", encoding="utf-8", buffering=1)
         
         # Start dictation
         print("\n=== Whisper Dictation Tool ===")
@@ -756,66 +1217,84 @@ def main():
         
         try:
             if args.continuous:
-                # Continuous dictation mode
-                while running:
-                    # Record audio
-                    audio_file = record_audio(duration=args.duration, device_index=device_index)
-                    
-                    if not running:
-                        break
-                    
-                    # Transcribe
-                    print("Transcribing...")
-                    result = model.transcribe(
-                        audio_file, 
-                        language=language,
-                        fp16=False
-                    )
-                    
-                    # Output result
-                    transcription = result["text"].strip()
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-                    
-                    if transcription:
-                        print(f"[{timestamp}] {transcription}")
+                # Continuous dictation mode: a recorder thread keeps capturing
+                # the next chunk while this thread transcribes the previous one
+                chunks = queue.Queue(maxsize=2)
+                stop_recording = threading.Event()
+                
+                def fill_queue():
+                    """Record back-to-back chunks into the queue until stopped"""
+                    # Always send the end marker, even if capture fails
+                    try:
+                        for audio in session.record_chunks(args.duration, stop_recording):
+                            chunks.put(audio)
+                    finally:
+                        chunks.put(None)
+                
+                recorder = threading.Thread(target=fill_queue, daemon=True)
+                recorder.start()
+                
+                try:
+                    while running:
+                        # Time out regularly so Ctrl+C is still noticed on Windows
+                        try:
+                            audio = chunks.get(timeout=0.5)
+                        except queue.Empty:
+                            continue
+                        if audio is None:
+                            break
                         
-                        # Save to file if specified
-                        if output_file:
-                            output_file.write(f"{transcription}\n")
-                            output_file.flush()
+                        audio = prepare_chunk(audio, args.silence_rms, vad=not args.no_vad)
+                        if len(audio) == 0:
+                            print("[silence]")
+                            continue
                         
-                        # Copy to clipboard if requested - ALWAYS do this in continuous mode for convenience
-                        pyperclip.copy(transcription)
-                        print("(Copied to clipboard - press Ctrl+V to paste)")
+                        # Transcribe
+                        print("Transcribing...")
+                        result = transcriber.transcribe(audio)
                         
-                        # Auto-paste if requested
-                        if args.autopaste:
-                            print(f"Auto-pasting in {args.delay} seconds... (Move cursor to desired location)")
-                            time.sleep(args.delay)
-                            pyautogui.hotkey('ctrl', 'v')  # For Windows/Linux
-                            # Alternatively for macOS: pyautogui.hotkey('command', 'v')
-                            print("(Pasted)")
-                    
-                    # Clean up temporary file
-                    try:
-                        os.remove(audio_file)
-                    except:
-                        pass
-                    
-                    # Brief pause to allow for interruption
-                    time.sleep(0.5)
+                        # Output result
+                        transcription = result["text"].strip()
+                        timestamp = time.strftime("%H:%M:%S")
+                        
+                        if transcription:
+                            print(f"[{timestamp}] {transcription}")
+                            
+                            # Save to file if specified
+                            if output_file:
+                                output_file.write(f"{transcription}\n")
+                            
+                            # Copy to clipboard if requested - ALWAYS do this in continuous mode for convenience
+                            pyperclip.copy(transcription)
+                            print("(Copied to clipboard - press Ctrl+V to paste)")
+                            
+                            # Auto-paste if requested
+                            if args.autopaste:
+                                print(f"Auto-pasting in {args.delay} seconds... (Move cursor to desired location, SPACE to paste now)")
+                                wait_for_paste(args.delay)
+                                paste_clipboard()
+                                print("(Pasted)")
+                
+                finally:
+                    # Stop the recorder, draining the queue so it cannot block on put()
+                    stop_recording.set()
+                    while recorder.is_alive():
+                        try:
+                            chunks.get(timeout=0.1)
+                        except queue.Empty:
+                            pass
             
             else:
                 # Single recording mode
-                audio_file = record_audio(duration=args.duration, device_index=device_index)
+                audio = session.record(args.duration)
+                if not args.no_vad:
+                    audio = trim_silence(audio)
                 
-                if running:
+                if running and len(audio) == 0:
+                    print("(No speech detected)")
+                elif running:
                     print("Transcribing...")
-                    result = model.transcribe(
-                        audio_file, 
-                        language=language,
-                        fp16=False
-                    )
+                    result = transcriber.transcribe(audio)
                     
                     # Output result
                     transcription = result["text"].strip()
@@ -834,17 +1313,10 @@ def main():
                         
                         # Auto-paste if requested
                         if args.autopaste:
-                            print(f"Auto-pasting in {args.delay} seconds... (Move cursor to desired location)")
-                            time.sleep(args.delay)
-                            pyautogui.hotkey('ctrl', 'v')  # For Windows/Linux
-                            # Alternatively for macOS: pyautogui.hotkey('command', 'v')
+                            print(f"Auto-pasting in {args.delay} seconds... (Move cursor to desired location, SPACE to paste now)")
+                            wait_for_paste(args.delay)
+                            paste_clipboard()
                             print("(Pasted)")
-                    
-                    # Clean up temporary file
-                    try:
-                        os.remove(audio_file)
-                    except:
-                        pass
         
         finally:
             # Close output file if opened
@@ -857,6 +1329,10 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
     finally:
+        if session is not None:
+            session.close()
+        terminate_pa()
+        
         # Ensure keyboard listener is stopped
         if keyboard and hasattr(keyboard, '_listener') and keyboard._listener:
             keyboard._listener.stop()
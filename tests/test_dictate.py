@@ -0,0 +1,124 @@
+import importlib.util
+import os.path
+
+import numpy as np
+import pytest
+
+for _module in ("numba", "pyaudio", "pyperclip", "pyautogui", "keyboard"):
+    pytest.importorskip(_module)
+
+
+@pytest.fixture(scope="module")
+def dictate():
+    path = os.path.join(os.path.dirname(__file__), "..", "apps", "dictate.py")
+    spec = importlib.util.spec_from_file_location("dictate", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def rms_vad(dictate, monkeypatch):
+    # Use the deterministic RMS fallback instead of webrtcvad
+    monkeypatch.setattr(dictate, "webrtcvad", None)
+    return dictate
+
+
+def tone(frames, amplitude=0.5, rate=16000):
+    t = np.arange(frames * rate // 50) / rate
+    return (amplitude * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+@pytest.mark.parametrize("frames", [3, 10, 20])
+def test_trim_silence_short_clip(rms_vad, frames):
+    audio = tone(frames)
+    trimmed = rms_vad.trim_silence(audio)
+    assert len(trimmed) == len(audio)
+
+
+def test_trim_silence_cuts_silence(rms_vad):
+    silence = np.zeros(100 * 320, dtype=np.float32)
+    audio = np.concatenate([silence, tone(10), silence])
+    trimmed = rms_vad.trim_silence(audio)
+
+    pad = rms_vad.VAD_PAD_MS // rms_vad.VAD_FRAME_MS
+    assert len(trimmed) == (10 + 2 * pad) * 320
+
+
+def test_trim_silence_skips_silent_clip(rms_vad):
+    assert len(rms_vad.trim_silence(np.zeros(16000, dtype=np.float32))) == 0
+    assert len(rms_vad.trim_silence(tone(2))) == 0
+
+
+def pcm(samples):
+    return np.asarray(samples, dtype=np.int16).tobytes()
+
+
+def test_max_abs_i16(dictate):
+    assert dictate.max_abs_i16(np.array([-32768, 5], dtype=np.int16)) == 32768
+    assert dictate.max_abs_i16(np.array([3, -7, 6], dtype=np.int16)) == 7
+    assert dictate.max_abs_i16(np.array([], dtype=np.int16)) == 0
+
+
+def test_capture_buffer_completes_at_limit(dictate):
+    capture = dictate.CaptureBuffer(1000)
+    capture.reset(500)
+    source = np.arange(600, dtype=np.int16)
+
+    assert capture.callback(pcm(source[:300]), 300, None, 0)[1] == dictate.pyaudio.paContinue
+    assert capture.callback(pcm(source[300:]), 300, None, 0)[1] == dictate.pyaudio.paComplete
+    assert capture.full.is_set()
+    assert np.allclose(capture.audio(), source[:500] / 32768.0)
+
+
+def test_capture_buffer_ring_wraps(dictate):
+    capture = dictate.CaptureBuffer(1000)
+    capture.reset(1000, ring=True)
+    source = np.arange(2400, dtype=np.int16)
+
+    for start in range(0, len(source), 300):
+        status = capture.callback(pcm(source[start:start + 300]), 300, None, 0)[1]
+        assert status == dictate.pyaudio.paContinue
+    assert capture.filled == 2400
+    assert not capture.full.is_set()
+
+    # The last 1000 samples are still in the ring; 2000 is where it wraps
+    for start, stop in [(1400, 2400), (1500, 2300), (1900, 2100), (2000, 2400)]:
+        assert np.allclose(capture.audio(start, stop), source[start:stop] / 32768.0)
+
+
+def test_record_chunks_skips_overwritten_audio(dictate):
+    source = np.arange(2000, dtype=np.int16)
+
+    class FakeStream:
+        def start_stream(self):
+            # Deliver more audio than the ring holds before the first chunk is read
+            for start in range(0, len(source), 100):
+                session.capture.callback(pcm(source[start:start + 100]), 100, None, 0)
+
+        def stop_stream(self):
+            pass
+
+    session = dictate.RecordingSession.__new__(dictate.RecordingSession)
+    session.capture = dictate.CaptureBuffer(640)
+    session.stream = FakeStream()
+
+    step = int(dictate.RATE * 0.01)
+    chunks = session.record_chunks(0.01)
+    received = [next(chunks) for _ in range(3)]
+    chunks.close()
+
+    first = 2000 + step - len(session.capture.samples)
+    for i, chunk in enumerate(received):
+        start = first + i * step
+        assert np.allclose(chunk, source[start:start + step] / 32768.0)
+
+
+def test_prepare_chunk(rms_vad):
+    assert len(rms_vad.prepare_chunk(np.zeros(16000, dtype=np.float32))) == 0
+    assert len(rms_vad.prepare_chunk(tone(50, amplitude=0.001))) == 0
+
+    audio = tone(50)
+    assert len(rms_vad.prepare_chunk(audio)) == len(audio)
+    assert len(rms_vad.prepare_chunk(audio, vad=False)) == len(audio)
+    assert len(rms_vad.prepare_chunk(audio, silence_rms=0)) == len(audio)